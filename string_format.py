@@ -13,7 +13,8 @@ Version: 1.0.0
 License: MIT
 
 Dependencies:
-    - functools (standard library)
+    - functools (standard library, for lru_cache)
+    - collections.abc (standard library, for type annotations)
 
 Examples:
     >>> from string_format import string_formatter
@@ -23,13 +24,67 @@ Examples:
 """
 
 
-from functools import singledispatch
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
 
 __version__ = "1.0.0"
 __author__ = "Shuai Lu (卢帅)"
 __email__ = "lushuai@stu.xmu.edu.cn"
 
-__all__ = ['string_formatter']
+__all__ = ['string_formatter', 'string_formatter_many', 'string_formatter_bytes', 'Style']
+
+# Reset sequence appended after styled text.
+_RESET = "\033[0m"
+_RESET_B = _RESET.encode("ascii")
+
+# SGR parameters for the named colors.
+_FG_CODES = {
+    "black": 30,
+    "red": 31,
+    "green": 32,
+    "yellow": 33,
+    "blue": 34,
+    "purple": 35,
+    "cyan": 36,
+    "white": 37,
+    "bright_black": 90,
+    "bright_red": 91,
+    "bright_green": 92,
+    "bright_yellow": 93,
+    "bright_blue": 94,
+    "bright_purple": 95,
+    "bright_cyan": 96,
+    "bright_white": 97,
+}
+
+# Background codes are the foreground codes offset by 10 (40-47, 100-107).
+_BG_CODES = {name: code + 10 for name, code in _FG_CODES.items()}
+
+# Precomputed ANSI escape codes, built once at import time.
+_FG_NAMED = {name: f"\033[{code}m" for name, code in _FG_CODES.items()}
+_BG_NAMED = {name: f"\033[{code}m" for name, code in _BG_CODES.items()}
+
+# SGR parameters and escape codes for every combination of the font flags
+# (bold, thin, italics, underline, strikethrough), indexed by bit mask.
+_FONT_CODES = (1, 2, 3, 4, 9)
+_FONT_PARAMS = tuple(
+    tuple(code for bit, code in enumerate(_FONT_CODES) if mask >> bit & 1)
+    for mask in range(32)
+)
+_FONT_TABLE = tuple(
+    "".join(f"\033[{code}m" for code in params) for params in _FONT_PARAMS
+)
+
+_FG_256 = {i: f"\033[38;5;{i}m" for i in range(256)}
+_BG_256 = {i: f"\033[48;5;{i}m" for i in range(256)}
+
+
+# Prefixes for styles made only of named colors or None, keyed by
+# (bg_color, fg_color, flags) and filled on first use. There are at most
+# 17 * 17 * 32 such styles, so the table needs no bound. Only exact str keys
+# are stored, so no other type can compare equal to one.
+_PREFIX_CACHE: dict[tuple, str] = {}
+
 
 def string_formatter(
     string: str,
@@ -66,203 +121,586 @@ def string_formatter(
     Returns
     -------
     str
-        The formatted string with ANSI escape codes.
+        The formatted string with ANSI escape codes, or the input string
+        unchanged if no style is requested.
     """
-    bg_color = bg_color and background_color(bg_color) or ""
-    fg_color = fg_color and foreground_color(fg_color) or ""
-    font = fontformat(bold, thin, italics, underline, strikethrough)
+    flags = (
+        (1 if bold else 0)
+        | (2 if thin else 0)
+        | (4 if italics else 0)
+        | (8 if underline else 0)
+        | (16 if strikethrough else 0)
+    )
+    if not flags and bg_color is None and fg_color is None:
+        return string
+
+    if (bg_color is None or type(bg_color) is str) and (
+        fg_color is None or type(fg_color) is str
+    ):
+        key = (bg_color, fg_color, flags)
+        prefix = _PREFIX_CACHE.get(key)
+        if prefix is None:
+            prefix = _PREFIX_CACHE[key] = _style_prefix(bg_color, fg_color, flags)
+    else:
+        prefix = _style_prefix(bg_color, fg_color, flags)
 
-    return "".join([bg_color, fg_color, font, string, "\033[0m"])
+    return f"{prefix}{string}{_RESET}"
 
 
-@singledispatch
-def escape_codes_color_fg(color):
+def string_formatter_many(
+    strings: Iterable[str],
+    bg_color: str | int | tuple | None = None,
+    fg_color: str | int | tuple | None = None,
+    bold: bool = False,
+    thin: bool = False,
+    italics: bool = False,
+    underline: bool = False,
+    strikethrough: bool = False,
+    sep: str = "\n",
+) -> str:
     """
-    Generate an ANSI escape code for the foreground color.
+    Format several strings with the same style and join them.
+
+    Each string is styled independently, and the style is reset before
+    every separator so it does not bleed across lines.
 
     Parameters
     ----------
-    color : int
-        The color code for the foreground color.
+    strings : iterable of str
+        The input strings to format.
+    bg_color : str | int | tuple, optional
+        The background color as a string, integer, or tuple of RGB values.
+    fg_color : str | int | tuple, optional
+        The foreground color as a string, integer, or tuple of RGB values.
+    bold : bool, optional
+        Whether to apply bold formatting. Default is False.
+    thin : bool, optional
+        Whether to apply thin formatting. Default is False.
+    italics : bool, optional
+        Whether to apply italics formatting. Default is False.
+    underline : bool, optional
+        Whether to apply underline formatting. Default is False.
+    strikethrough : bool, optional
+        Whether to apply strikethrough formatting. Default is False.
+    sep : str, optional
+        The separator inserted between the formatted strings. Default is "\\n".
 
     Returns
     -------
     str
-        The ANSI escape code for the foreground color.
+        The formatted strings joined by ``sep``.
+    """
+    items = list(strings)
+    flags = (
+        (1 if bold else 0)
+        | (2 if thin else 0)
+        | (4 if italics else 0)
+        | (8 if underline else 0)
+        | (16 if strikethrough else 0)
+    )
+    if not items or (not flags and bg_color is None and fg_color is None):
+        return sep.join(items)
+
+    prefix = _style_prefix(bg_color, fg_color, flags)
+    joiner = f"{_RESET}{sep}{prefix}"
+    return f"{prefix}{joiner.join(items)}{_RESET}"
+
+
+def string_formatter_bytes(
+    string: bytes,
+    bg_color: str | int | tuple | None = None,
+    fg_color: str | int | tuple | None = None,
+    bold: bool = False,
+    thin: bool = False,
+    italics: bool = False,
+    underline: bool = False,
+    strikethrough: bool = False,
+) -> bytes:
+    """
+    Format an encoded string with background and foreground colors and font styles.
+
+    Same as `string_formatter`, but takes and returns bytes so the result can
+    be written directly to a binary stream such as ``sys.stdout.buffer``.
+
+    Parameters
+    ----------
+    string : bytes
+        The input string to format, already encoded.
+    bg_color : str | int | tuple, optional
+        The background color as a string, integer, or tuple of RGB values.
+    fg_color : str | int | tuple, optional
+        The foreground color as a string, integer, or tuple of RGB values.
+    bold : bool, optional
+        Whether to apply bold formatting. Default is False.
+    thin : bool, optional
+        Whether to apply thin formatting. Default is False.
+    italics : bool, optional
+        Whether to apply italics formatting. Default is False.
+    underline : bool, optional
+        Whether to apply underline formatting. Default is False.
+    strikethrough : bool, optional
+        Whether to apply strikethrough formatting. Default is False.
+
+    Returns
+    -------
+    bytes
+        The formatted bytes with ANSI escape codes, or the input unchanged
+        if no style is requested.
     """
-    return f"\033[{color}m"
+    flags = (
+        (1 if bold else 0)
+        | (2 if thin else 0)
+        | (4 if italics else 0)
+        | (8 if underline else 0)
+        | (16 if strikethrough else 0)
+    )
+    if not flags and bg_color is None and fg_color is None:
+        return string
 
+    return b"".join((_style_prefix_bytes(bg_color, fg_color, flags), string, _RESET_B))
 
-@escape_codes_color_fg.register
-def _(color: str):
+
+class Style:
     """
-    Generate an ANSI escape code for the foreground color from a string.
+    A precompiled text style for formatting many strings the same way.
+
+    The escape sequence is built once in the constructor, so calling the
+    style only concatenates strings.
 
     Parameters
     ----------
-    color : str
-        The color name (e.g., "red", "blue", "bright_black").
+    bg_color : str | int | tuple, optional
+        The background color as a string, integer, or tuple of RGB values.
+    fg_color : str | int | tuple, optional
+        The foreground color as a string, integer, or tuple of RGB values.
+    bold : bool, optional
+        Whether to apply bold formatting. Default is False.
+    thin : bool, optional
+        Whether to apply thin formatting. Default is False.
+    italics : bool, optional
+        Whether to apply italics formatting. Default is False.
+    underline : bool, optional
+        Whether to apply underline formatting. Default is False.
+    strikethrough : bool, optional
+        Whether to apply strikethrough formatting. Default is False.
+
+    Examples
+    --------
+    >>> red_bold = Style(fg_color="red", bold=True)
+    >>> red_bold("Hello World") == string_formatter("Hello World", fg_color="red", bold=True)
+    True
+    """
+
+    __slots__ = ("_prefix", "_suffix")
+
+    def __init__(
+        self,
+        bg_color: str | int | tuple | None = None,
+        fg_color: str | int | tuple | None = None,
+        bold: bool = False,
+        thin: bool = False,
+        italics: bool = False,
+        underline: bool = False,
+        strikethrough: bool = False,
+    ) -> None:
+        flags = _pack_flags(bold, thin, italics, underline, strikethrough)
+        self._prefix = _style_prefix(bg_color, fg_color, flags)
+        self._suffix = _RESET if self._prefix else ""
+
+    def __call__(self, string: str) -> str:
+        """
+        Format a string with this style.
+
+        Parameters
+        ----------
+        string : str
+            The input string to format.
+
+        Returns
+        -------
+        str
+            The formatted string with ANSI escape codes.
+        """
+        return f"{self._prefix}{string}{self._suffix}"
+
+    def wrap(self, strings: Iterable[str]) -> Iterator[str]:
+        """
+        Lazily format each string of an iterable with this style.
+
+        Parameters
+        ----------
+        strings : iterable of str
+            The input strings to format.
+
+        Yields
+        ------
+        str
+            Each formatted string with ANSI escape codes.
+        """
+        prefix = self._prefix
+        suffix = self._suffix
+        for string in strings:
+            yield f"{prefix}{string}{suffix}"
+
+
+def _pack_flags(
+    bold: bool, thin: bool, italics: bool, underline: bool, strikethrough: bool
+) -> int:
+    """
+    Pack the font styles into a bit mask.
+
+    Each argument is tested for truth, so any truthy or falsy value works.
+
+    Parameters
+    ----------
+    bold, thin, italics, underline, strikethrough : bool
+        Whether to apply each font style.
 
     Returns
     -------
-    str
-        The ANSI escape code for the foreground color.
+    int
+        The bit mask in 0-31, with bold in the lowest bit.
     """
-    color_fg = {
-        "black": 30,
-        "red": 31,
-        "green": 32,
-        "yellow": 33,
-        "blue": 34,
-        "purple": 35,
-        "cyan": 36,
-        "white": 37,
-        "bright_black": 90,
-        "bright_red": 91,
-        "bright_green": 92,
-        "bright_yellow": 93,
-        "bright_blue": 94,
-        "bright_purple": 95,
-        "bright_cyan": 96,
-        "bright_white": 97,
-    }
-    return f"\033[{color_fg[color]}m"
-
-
-@escape_codes_color_fg.register
-def _(color: tuple):
-    """
-    Generate an ANSI escape code for the foreground color from a tuple of RGB values.
+    return (
+        (1 if bold else 0)
+        | (2 if thin else 0)
+        | (4 if italics else 0)
+        | (8 if underline else 0)
+        | (16 if strikethrough else 0)
+    )
+
+
+@lru_cache(maxsize=512)
+def _style_prefix(
+    bg_color: str | int | tuple | None,
+    fg_color: str | int | tuple | None,
+    flags: int,
+) -> str:
+    """
+    Build the SGR escape sequence for a combination of style arguments.
 
     Parameters
     ----------
-    color : tuple of int
-        A tuple containing the RGB values (e.g., (255, 0, 0) for red).
+    bg_color : str | int | tuple | None
+        The background color as a string, integer, or tuple of RGB values.
+    fg_color : str | int | tuple | None
+        The foreground color as a string, integer, or tuple of RGB values.
+    flags : int
+        The font styles packed as bits: bold, thin, italics, underline and
+        strikethrough, from the lowest bit up.
 
     Returns
     -------
     str
-        The ANSI escape code for the foreground color.
+        The combined ANSI escape sequence, or "" if no style is requested.
+    """
+    params: list[int] = []
+    if bg_color is not None:
+        params.extend(_bg_params(bg_color))
+    if fg_color is not None:
+        params.extend(_fg_params(fg_color))
+    params.extend(_FONT_PARAMS[flags])
+
+    return f"\033[{';'.join(map(str, params))}m" if params else ""
+
+
+@lru_cache(maxsize=512)
+def _style_prefix_bytes(
+    bg_color: str | int | tuple | None,
+    fg_color: str | int | tuple | None,
+    flags: int,
+) -> bytes:
+    """
+    Build the SGR escape sequence for a combination of style arguments as bytes.
+
+    Parameters
+    ----------
+    bg_color : str | int | tuple | None
+        The background color as a string, integer, or tuple of RGB values.
+    fg_color : str | int | tuple | None
+        The foreground color as a string, integer, or tuple of RGB values.
+    flags : int
+        The font styles packed as bits, as for `_style_prefix`.
+
+    Returns
+    -------
+    bytes
+        The ASCII-encoded escape sequence, or b"" if no style is requested.
     """
-    return f"\033[38;2;{color[0]};{color[1]};{color[2]}m"
+    return _style_prefix(bg_color, fg_color, flags).encode("ascii")
 
 
-@escape_codes_color_fg.register
-def _(color: int):
+def _plain_color(color: object, kind: str) -> str | int | tuple:
     """
-    Generate an ANSI escape code for the foreground color from a 256-color code.
+    Convert an instance of a str, int or tuple subclass to the plain type.
+
+    This is the slow path for colors such as a namedtuple of RGB values, an
+    IntEnum palette index, a bool (True is index 1) or a str subclass. Any
+    other number equal to a whole number, such as 1.0, is taken as that
+    256-color code, so colors that compare equal always give the same result.
 
     Parameters
     ----------
-    color : int
-        The 256-color code.
+    color : object
+        The color to convert.
+    kind : str
+        "foreground" or "background", used in the error message.
 
     Returns
     -------
-    str
-        The ANSI escape code for the foreground color.
+    str | int | tuple
+        The color as an exact str, int or tuple.
+
+    Raises
+    ------
+    TypeError
+        If the color type is not supported.
     """
-    return f"\033[38;5;{color}m"
+    if isinstance(color, str):
+        return str.__str__(color)
+    if isinstance(color, int):
+        return int(color)
+    if isinstance(color, tuple):
+        return tuple(color)
+    real = getattr(color, "real", None)
+    if real is not None:
+        try:
+            index = int(real)
+        except (TypeError, ValueError, OverflowError):
+            pass
+        else:
+            if index == color:
+                return index
+    raise TypeError(f"Unsupported {kind} color type: {type(color).__name__}")
+
+
+def _fg_params(color: str | int | tuple) -> tuple[int, ...]:
+    """
+    Get the SGR parameters for the foreground color.
 
+    Parameters
+    ----------
+    color : str | int | tuple
+        The color name, a 256-color code, or a tuple of RGB values.
+
+    Returns
+    -------
+    tuple of int
+        The SGR parameters, e.g. (31,), (38, 5, n) or (38, 2, r, g, b).
 
-@singledispatch
-def escape_codes_color_bg(color):
+    Raises
+    ------
+    TypeError
+        If the color type is not supported.
+    ValueError
+        If an RGB tuple does not hold three whole numbers in 0-255.
+    KeyError
+        If the color name is unknown.
     """
-    Generate an ANSI escape code for the background color.
+    if type(color) is str:
+        return (_FG_CODES[color],)
+    if type(color) is int:
+        return (38, 5, color)
+    if type(color) is tuple:
+        return (38, 2, *_rgb_components(color))
+    return _fg_params(_plain_color(color, "foreground"))
+
+
+def _bg_params(color: str | int | tuple) -> tuple[int, ...]:
+    """
+    Get the SGR parameters for the background color.
 
     Parameters
     ----------
-    color : int
-        The color code for the background color.
+    color : str | int | tuple
+        The color name, a 256-color code, or a tuple of RGB values.
 
     Returns
     -------
-    str
-        The ANSI escape code for the background color.
+    tuple of int
+        The SGR parameters, e.g. (41,), (48, 5, n) or (48, 2, r, g, b).
+
+    Raises
+    ------
+    TypeError
+        If the color type is not supported.
+    ValueError
+        If an RGB tuple does not hold three whole numbers in 0-255.
+    KeyError
+        If the color name is unknown.
     """
-    return f"\033[{color}m"
+    if type(color) is str:
+        return (_BG_CODES[color],)
+    if type(color) is int:
+        return (48, 5, color)
+    if type(color) is tuple:
+        return (48, 2, *_rgb_components(color))
+    return _bg_params(_plain_color(color, "background"))
 
 
-@escape_codes_color_bg.register
-def _(color: str):
+def _fg(color: str | int | tuple) -> str:
     """
-    Generate an ANSI escape code for the background color from a string.
+    Generate an ANSI escape code for the foreground color.
 
     Parameters
     ----------
-    color : str
-        The color name (e.g., "red", "blue", "bright_black").
+    color : str | int | tuple
+        The color name (e.g., "red", "bright_black"), a 256-color code, or
+        a tuple of RGB values (e.g., (255, 0, 0) for red).
+
+    Returns
+    -------
+    str
+        The ANSI escape code for the foreground color.
+
+    Raises
+    ------
+    TypeError
+        If the color type is not supported.
+    ValueError
+        If an RGB tuple does not hold three whole numbers in 0-255.
+    KeyError
+        If the color name is unknown.
+    """
+    if type(color) is str:
+        return _FG_NAMED[color]
+    if type(color) is int:
+        code = _FG_256.get(color)
+        if code is not None:
+            return code
+        return f"\033[38;5;{color}m"
+    if type(color) is tuple:
+        return _rgb_fg(color)
+    return _fg(_plain_color(color, "foreground"))
+
+
+def _bg(color: str | int | tuple) -> str:
+    """
+    Generate an ANSI escape code for the background color.
+
+    Parameters
+    ----------
+    color : str | int | tuple
+        The color name (e.g., "red", "bright_black"), a 256-color code, or
+        a tuple of RGB values (e.g., (255, 0, 0) for red).
 
     Returns
     -------
     str
         The ANSI escape code for the background color.
+
+    Raises
+    ------
+    TypeError
+        If the color type is not supported.
+    ValueError
+        If an RGB tuple does not hold three whole numbers in 0-255.
+    KeyError
+        If the color name is unknown.
+    """
+    if type(color) is str:
+        return _BG_NAMED[color]
+    if type(color) is int:
+        code = _BG_256.get(color)
+        if code is not None:
+            return code
+        return f"\033[48;5;{color}m"
+    if type(color) is tuple:
+        return _rgb_bg(color)
+    return _bg(_plain_color(color, "background"))
+
+
+def _rgb_components(rgb: tuple) -> tuple[int, int, int]:
+    """
+    Validate an RGB color and return its components as ints.
+
+    Each component must equal a whole number in 0-255, so equal values such
+    as 1, 1.0 and True are always treated the same.
+
+    Parameters
+    ----------
+    rgb : tuple
+        A tuple containing the RGB values (e.g., (255, 0, 0) for red).
+
+    Returns
+    -------
+    tuple of int
+        The red, green and blue components.
+
+    Raises
+    ------
+    ValueError
+        If the tuple does not hold three whole numbers in 0-255.
+    """
+    if len(rgb) != 3:
+        raise ValueError(f"RGB color must have exactly three values, got {rgb!r}")
+    r, g, b = rgb
+    try:
+        components = (int(r), int(g), int(b))
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(
+            f"RGB values must be whole numbers in 0-255, got {rgb!r}"
+        ) from None
+    if components != (r, g, b) or min(components) < 0 or max(components) > 255:
+        raise ValueError(f"RGB values must be whole numbers in 0-255, got {rgb!r}")
+    return components
+
+
+@lru_cache(maxsize=1024)
+def _rgb_fg(rgb: tuple) -> str:
     """
-    color_bg = {
-        "black": 40,
-        "red": 41,
-        "green": 42,
-        "yellow": 43,
-        "blue": 44,
-        "purple": 45,
-        "cyan": 46,
-        "white": 47,
-        "black": 100,
-        "red": 101,
-        "green": 102,
-        "yellow": 103,
-        "blue": 104,
-        "purple": 105,
-        "cyan": 106,
-        "white": 107,
-    }
-    return f"\033[{color_bg[color]}m"
-
-
-@escape_codes_color_bg.register
-def _(color: tuple):
-    """
-    Generate an ANSI escape code for the background color from a tuple of RGB values.
+    Generate an ANSI escape code for a foreground RGB color.
 
     Parameters
     ----------
-    color : tuple of int
+    rgb : tuple of int
         A tuple containing the RGB values (e.g., (255, 0, 0) for red).
 
     Returns
     -------
     str
-        The ANSI escape code for the background color.
+        The ANSI escape code for the foreground color.
     """
-    return f"\033[48;2;{color[0]};{color[1]};{color[2]}m"
+    r, g, b = _rgb_components(rgb)
+    return f"\033[38;2;{r};{g};{b}m"
 
 
-@escape_codes_color_bg.register
-def _(color: int):
+@lru_cache(maxsize=1024)
+def _rgb_bg(rgb: tuple) -> str:
     """
-    Generate an ANSI escape code for the background color from a 256-color code.
+    Generate an ANSI escape code for a background RGB color.
 
     Parameters
     ----------
-    color : int
-        The 256-color code.
+    rgb : tuple of int
+        A tuple containing the RGB values (e.g., (255, 0, 0) for red).
 
     Returns
     -------
     str
         The ANSI escape code for the background color.
     """
-    return f"\033[48;5;{color}m"
+    r, g, b = _rgb_components(rgb)
+    return f"\033[48;2;{r};{g};{b}m"
+
+
+escape_codes_color_fg = _fg
+escape_codes_color_bg = _bg
 
 
-def foreground_color(*args):
+def foreground_color(
+    color: str | int | tuple, g: int | None = None, b: int | None = None
+) -> str:
     """
     Generate the ANSI escape code for the foreground color.
 
     Parameters
     ----------
-    *args : (str | int | tuple)
-        The foreground color as a string, integer, or tuple of RGB values.
+    color : str | int | tuple
+        The foreground color as a string, integer, or tuple of RGB values,
+        or the red component when ``g`` and ``b`` are given.
+    g, b : int, optional
+        The green and blue components of an RGB color.
 
     Returns
     -------
@@ -273,23 +711,29 @@ def foreground_color(*args):
     ------
     TypeError
         If the input format is invalid.
+    ValueError
+        If an RGB color does not hold three whole numbers in 0-255.
     """
-    if len(args) == 1:
-        return escape_codes_color_fg(args[0])
-    elif len(args) == 3 and all(isinstance(a, int) for a in args):
-        return escape_codes_color_fg(args)
-    else:
-        raise TypeError("Invalid input format for foreground_color")
+    if g is None and b is None:
+        return _fg(color)
+    if isinstance(color, int) and isinstance(g, int) and isinstance(b, int):
+        return _fg((color, g, b))
+    raise TypeError("Invalid input format for foreground_color")
 
 
-def background_color(*args):
+def background_color(
+    color: str | int | tuple, g: int | None = None, b: int | None = None
+) -> str:
     """
     Generate the ANSI escape code for the background color.
 
     Parameters
     ----------
-    *args : (str | int | tuple)
-        The background color as a string, integer, or tuple of RGB values.
+    color : str | int | tuple
+        The background color as a string, integer, or tuple of RGB values,
+        or the red component when ``g`` and ``b`` are given.
+    g, b : int, optional
+        The green and blue components of an RGB color.
 
     Returns
     -------
@@ -300,13 +744,21 @@ def background_color(*args):
     ------
     TypeError
         If the input format is invalid.
+    ValueError
+        If an RGB color does not hold three whole numbers in 0-255.
+
+    Examples
+    --------
+    >>> background_color("red") == "\033[41m"
+    True
+    >>> background_color("bright_red") == "\033[101m"
+    True
     """
-    if len(args) == 1:
-        return escape_codes_color_bg(args[0])
-    elif len(args) == 3 and all(isinstance(a, int) for a in args):
-        return escape_codes_color_bg(args)
-    else:
-        raise TypeError("Invalid input format for background_color")
+    if g is None and b is None:
+        return _bg(color)
+    if isinstance(color, int) and isinstance(g, int) and isinstance(b, int):
+        return _bg((color, g, b))
+    raise TypeError("Invalid input format for background_color")
 
 
 def color(
@@ -327,10 +779,10 @@ def color(
     str
         The combined ANSI escape codes for the background and foreground colors.
     """
-    bg_color = bg_color and background_color(bg_color) or ""
-    fg_color = bg_color and background_color(fg_color) or ""
+    bg_color = _bg(bg_color) if bg_color is not None else ""
+    fg_color = _fg(fg_color) if fg_color is not None else ""
 
-    return "".join([bg_color, fg_color])
+    return f"{bg_color}{fg_color}"
 
 
 def fontformat(
@@ -361,10 +813,4 @@ def fontformat(
     str
         The ANSI escape codes for the font formatting.
     """
-    bold = bold and "\033[1m" or ""
-    thin = thin and "\033[2m" or ""
-    italics = italics and "\033[3m" or ""
-    underline = underline and "\033[4m" or ""
-    strikethrough = strikethrough and "\033[9m" or ""
-
-    return "".join([bold, thin, italics, underline, strikethrough])
+    return _FONT_TABLE[_pack_flags(bold, thin, italics, underline, strikethrough)]